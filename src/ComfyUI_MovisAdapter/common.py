@@ -1,11 +1,36 @@
 """Common utilities for MoviePy Adapter nodes."""
 
 import torch
-import numpy as np
-from moviepy import ImageSequenceClip
+import torch.nn.functional as F
+from itertools import chain
+from typing import TYPE_CHECKING
 
+# MoviePy is heavy to import, so it is only loaded when a clip is actually
+# built; this keeps ComfyUI startup fast when the nodes are just registered
+if TYPE_CHECKING:
+    from moviepy import ImageSequenceClip
 
-def image_tensor_to_moviepy_clip(tensor: torch.Tensor, fps: float = 24.0) -> ImageSequenceClip:
+
+# Compute precisions offered by nodes that blend pixels. ComfyUI IMAGE tensors
+# are float32, and narrowing them would cost a cast in and a cast out, which
+# outweighs the bandwidth saved on these single-pass ops. bf16/fp16 therefore
+# only apply to inputs that already are half precision (see resolve_compute_dtype).
+PRECISION_DTYPES = {
+    "fp32": torch.float32,
+    "bf16": torch.bfloat16,
+    "fp16": torch.float16,
+}
+
+# Optional node input selecting one of PRECISION_DTYPES
+PRECISION_INPUT = (list(PRECISION_DTYPES), {
+    "default": "fp32",
+    "tooltip": "Compute precision for pixel math on half precision inputs. "
+               "fp32 inputs are always processed in fp32; bf16/fp16 skip the upcast "
+               "for inputs that already are half precision, at up to ~1.3 uint8 steps of error."
+})
+
+
+def image_tensor_to_moviepy_clip(tensor: torch.Tensor, fps: float = 24.0) -> "ImageSequenceClip":
     """
     Convert ComfyUI IMAGE tensor to MoviePy VideoClip.
     
@@ -23,15 +48,17 @@ def image_tensor_to_moviepy_clip(tensor: torch.Tensor, fps: float = 24.0) -> Ima
     if len(tensor.shape) != 4:
         raise ValueError(f"Expected tensor with shape [B, H, W, C], got {tensor.shape}")
     
-    # Convert from torch tensor to numpy array
     # ComfyUI uses [0, 1] range, MoviePy expects [0, 255]
-    frames_numpy = tensor.cpu().numpy()
-    frames_numpy = (frames_numpy * 255).astype(np.uint8)
+    # Scale and quantize on the tensor's own device so only uint8 data
+    # crosses to the host (a single kernel on CUDA, 4x fewer bytes copied)
+    frames_u8 = (tensor.clamp(0.0, 1.0) * 255).to(torch.uint8).contiguous().cpu().numpy()
     
     # Convert to list of frames for ImageSequenceClip
-    frames_list = [frame for frame in frames_numpy]
+    # list() yields views into the single backing buffer, no per-frame copies
+    frames_list = list(frames_u8)
     
     # Create MoviePy clip
+    from moviepy import ImageSequenceClip
     clip = ImageSequenceClip(frames_list, fps=fps)
     
     return clip
@@ -51,23 +78,36 @@ def moviepy_clip_to_image_tensor(clip) -> torch.Tensor:
     if clip is None:
         raise ValueError("Input clip is None")
     
-    # Get frames from clip
-    # iter_frames returns frames as numpy arrays in [0, 255] range
-    frames_list = []
-    for frame in clip.iter_frames():
-        frames_list.append(frame)
+    # iter_frames yields int(duration * fps) frames, so the output batch can be
+    # allocated once up front instead of stacking a list of frames afterwards
+    width, height = clip.size
+    num_frames = int(clip.duration * clip.fps)
+    if num_frames <= 0:
+        raise ValueError("Clip contains no frames")
     
-    if not frames_list:
+    # Frames are read in their native dtype. MoviePy frames are in [0, 255]
+    # either way, but float frames (e.g. from generated or effect clips) keep
+    # their precision instead of being truncated to uint8 first
+    frames = clip.iter_frames()
+    first_frame = next(frames, None)
+    if first_frame is None:
         raise ValueError("Clip contains no frames")
+    frames = chain([first_frame], frames)
     
-    # Stack frames into numpy array
-    frames_numpy = np.stack(frames_list, axis=0)
+    # Collect uint8 frames as uint8 (a quarter of the float32 footprint) and
+    # float frames directly as float32, then normalize once at the end
+    staging_dtype = torch.float32 if first_frame.dtype.kind == "f" else torch.uint8
+    staging = torch.empty((num_frames, height, width, 3), dtype=staging_dtype)
     
-    # Convert from [0, 255] to [0, 1] range for ComfyUI
-    frames_numpy = frames_numpy.astype(np.float32) / 255.0
+    count = 0
+    for frame in frames:
+        if count == num_frames:
+            break
+        staging[count].copy_(torch.from_numpy(frame[..., :3]))
+        count += 1
     
-    # Convert to torch tensor
-    tensor = torch.from_numpy(frames_numpy)
+    # Convert from [0, 255] to [0, 1] range for ComfyUI in a single pass
+    tensor = staging[:count].to(torch.float32).div_(255.0)
     
     return tensor
 
@@ -95,3 +135,113 @@ def resize_clip_to_resolution(clip, target_width: int, target_height: int):
     
     return resized_clip
 
+
+def resize_image_tensor(tensor: torch.Tensor, target_width: int, target_height: int) -> torch.Tensor:
+    """
+    Resize ComfyUI IMAGE tensor to target resolution.
+    
+    All frames are resized in one batched bilinear interpolation on the
+    tensor's own device.
+    
+    Args:
+        tensor: torch.Tensor with shape [B, H, W, C]
+        target_width: Target width in pixels
+        target_height: Target height in pixels
+        
+    Returns:
+        torch.Tensor: Resized tensor with shape [B, target_height, target_width, C]
+    """
+    if tensor is None or tensor.numel() == 0:
+        raise ValueError("Input tensor is empty or None")
+    
+    if target_width <= 0 or target_height <= 0:
+        raise ValueError(f"Invalid target resolution: {target_width}x{target_height}")
+    
+    if tensor.shape[1:3] == (target_height, target_width):
+        return tensor
+    
+    # F.interpolate works on [B, C, H, W] floating point tensors
+    frames = tensor.permute(0, 3, 1, 2)
+    if not frames.is_floating_point():
+        frames = frames.float()
+    
+    resized = F.interpolate(frames, size=(target_height, target_width), mode="bilinear", align_corners=False)
+    
+    # Integer inputs are rounded back instead of truncated, which would
+    # darken every frame by half a step on average
+    if not tensor.is_floating_point():
+        info = torch.iinfo(tensor.dtype)
+        resized = resized.round_().clamp_(info.min, info.max)
+    
+    # Back to [B, H, W, C] in the input dtype
+    resized_tensor = resized.permute(0, 2, 3, 1).to(tensor.dtype).contiguous()
+    
+    return resized_tensor
+
+
+def convert_image_tensor(tensor: torch.Tensor, dtype: torch.dtype, device: torch.device | str | None = None) -> torch.Tensor:
+    """
+    Convert ComfyUI IMAGE tensor to another dtype and device, keeping its value range.
+    
+    Floating point IMAGE tensors are in [0.0, 1.0], integer ones in [0, 255],
+    so conversions between the two are rescaled by 255 (and rounded when
+    going to an integer dtype).
+    
+    Args:
+        tensor: torch.Tensor with shape [B, H, W, C]
+        dtype: Target dtype
+        device: Target device (default: keep the tensor's device)
+        
+    Returns:
+        torch.Tensor: Converted tensor, or the input itself if nothing changes
+    """
+    device = tensor.device if device is None else device
+    
+    if tensor.is_floating_point() == dtype.is_floating_point:
+        return tensor.to(device=device, dtype=dtype)
+    
+    if dtype.is_floating_point:
+        return tensor.to(device=device, dtype=dtype).div_(255.0)
+    
+    return (tensor.to(device) * 255.0).round_().clamp_(0.0, 255.0).to(dtype)
+
+
+def precision_to_dtype(precision: str) -> torch.dtype:
+    """
+    Map a node's precision option to the torch dtype used for pixel math.
+    
+    Args:
+        precision: One of the PRECISION_DTYPES keys ("fp32", "bf16", "fp16")
+        
+    Returns:
+        torch.dtype: Floating point dtype to compute in
+    """
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(f"Unknown precision: {precision}. Expected one of {list(PRECISION_DTYPES)}")
+    
+    return PRECISION_DTYPES[precision]
+
+
+def resolve_compute_dtype(tensor: torch.Tensor, precision: str) -> torch.dtype:
+    """
+    Pick the dtype to do a node's pixel math in.
+    
+    The precision option only narrows inputs that already are half precision,
+    so no extra casts are added for float32 IMAGE tensors.
+    
+    Args:
+        tensor: Input IMAGE tensor
+        precision: One of the PRECISION_DTYPES keys ("fp32", "bf16", "fp16")
+        
+    Returns:
+        torch.dtype: The requested dtype for half precision inputs with a
+                     half precision option, otherwise the input's own floating
+                     point dtype (float32 for integer inputs)
+    """
+    dtype = precision_to_dtype(precision)
+    
+    if tensor.dtype in (torch.float16, torch.bfloat16):
+        # Computing in the input's own half dtype avoids every cast
+        return torch.float32 if dtype == torch.float32 else tensor.dtype
+    
+    return tensor.dtype if tensor.is_floating_point() else torch.float32
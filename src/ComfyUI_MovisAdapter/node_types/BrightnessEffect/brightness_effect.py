@@ -1,8 +1,6 @@
 """BrightnessEffect node - Adjusts video brightness."""
 
 import torch
-from moviepy.video import fx
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor
 
 
 class MPABrightnessEffect:
@@ -52,14 +50,20 @@ class MPABrightnessEffect:
         Returns:
             Tuple containing the brightness-adjusted video as IMAGE tensor
         """
-        # Convert IMAGE tensor to MoviePy clip
-        clip = image_tensor_to_moviepy_clip(IMAGE, fps=fps)
+        # factor == 1.0 is the default and a no-op: skip all pixel work
+        if abs(factor - 1.0) < 1e-6:
+            return (IMAGE,)
         
-        # Apply brightness effect using MoviePy's colorx effect
-        # colorx multiplies all RGB values by the factor
-        adjusted_clip = clip.with_effects([fx.MultiplyColor(factor)])        
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(adjusted_clip)
+        # Brightness is a pure per-pixel multiply, so apply it directly to the
+        # whole IMAGE batch instead of round-tripping every frame through MoviePy.
+        # Matches MoviePy's MultiplyColor: min(1.0, factor * pixel)
+        if IMAGE.is_floating_point():
+            result_tensor = torch.clamp(IMAGE * factor, 0.0, 1.0)
+        elif IMAGE.dtype == torch.bool or IMAGE.is_complex():
+            raise ValueError(f"Unsupported IMAGE dtype: {IMAGE.dtype}")
+        else:
+            # Integer IMAGE tensors are in [0, 255]: same multiply in that
+            # domain, rounded back to the input dtype
+            result_tensor = IMAGE.float().mul_(factor).clamp_(0.0, 255.0).round_().to(IMAGE.dtype)
         
         return (result_tensor,)
-
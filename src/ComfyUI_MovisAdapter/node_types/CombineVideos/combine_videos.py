@@ -1,8 +1,7 @@
 """CombineVideos node - Combines multiple videos into one."""
 
 import torch
-from moviepy import concatenate_videoclips
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor, resize_clip_to_resolution
+from ...common import convert_image_tensor, resize_image_tensor
 
 
 class MPACombineVideos:
@@ -52,7 +51,8 @@ class MPACombineVideos:
         
         Args:
             IMAGE1: First video (required)
-            fps: Frames per second for the output video
+            fps: Frames per second for the output video (frames are concatenated
+                 as is, so this does not change the result)
             IMAGE2-IMAGE10: Additional videos (optional)
             
         Returns:
@@ -67,33 +67,23 @@ class MPACombineVideos:
         if len(video_inputs) == 0:
             raise ValueError("At least one video input is required")
         
-        # Convert all IMAGE tensors to MoviePy clips
-        clips = []
-        target_width = None
-        target_height = None
+        # A single input is returned as is
+        if len(video_inputs) == 1:
+            return (IMAGE1,)
         
-        for idx, video_tensor in enumerate(video_inputs):
-            # Convert to MoviePy clip
-            clip = image_tensor_to_moviepy_clip(video_tensor, fps=fps)
-            
-            # Get resolution of first video as target
-            if idx == 0:
-                target_width, target_height = clip.size
-                clips.append(clip)
-            else:
-                # Resize subsequent videos to match first video's resolution
-                if clip.size != (target_width, target_height):
-                    clip = resize_clip_to_resolution(clip, target_width, target_height)
-                clips.append(clip)
+        # Resolution of the first video is the target for all others
+        # IMAGE tensors are [B, H, W, C]
+        target_height, target_width = video_inputs[0].shape[1:3]
         
-        # Concatenate all clips
-        if len(clips) == 1:
-            combined_clip = clips[0]
-        else:
-            combined_clip = concatenate_videoclips(clips, method="compose")
+        # Resize videos that don't match the first video's resolution and bring
+        # them to its device and dtype
+        tensors = []
+        for video_tensor in video_inputs:
+            video_tensor = resize_image_tensor(video_tensor, target_width, target_height)
+            tensors.append(convert_image_tensor(video_tensor, IMAGE1.dtype, IMAGE1.device))
         
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(combined_clip)
+        # Sequential concatenation of equal-size IMAGE batches is a plain
+        # concatenation along the frame axis: one allocation, one copy per input
+        result_tensor = torch.cat(tensors, dim=0)
         
         return (result_tensor,)
-
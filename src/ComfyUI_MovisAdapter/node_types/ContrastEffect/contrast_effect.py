@@ -1,7 +1,38 @@
 """ContrastEffect node - Adjusts video contrast."""
 
-from moviepy.video import fx
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor
+from functools import lru_cache
+
+import numpy as np
+import torch
+from ...common import PRECISION_INPUT, resolve_compute_dtype
+
+@lru_cache(maxsize=1)
+def _get_contrast_kernel():
+    """
+    Compile the uint8 contrast kernel on first use.
+    
+    numba is optional and slow to import, so it is only loaded when a uint8
+    CPU input actually arrives instead of when the nodes are registered.
+    
+    Returns:
+        Compiled kernel, or None if numba is not installed
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional, uint8 inputs fall back to torch ops
+        return None
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _contrast_u8(pixels, factor):
+        """Apply contrast around mid-grey to a flat [N, C] uint8 array."""
+        out = np.empty_like(pixels)
+        for i in prange(pixels.shape[0]):
+            for c in range(pixels.shape[1]):
+                value = (pixels[i, c] - 127.5) * factor + 127.5
+                out[i, c] = np.uint8(min(max(value, 0.0), 255.0) + 0.5)
+        return out
+    
+    return _contrast_u8
 
 
 class MPAContrastEffect:
@@ -31,6 +62,9 @@ class MPAContrastEffect:
                     "step": 0.1,
                     "display": "number"
                 }),
+            },
+            "optional": {
+                "precision": PRECISION_INPUT,
             }
         }
     
@@ -39,7 +73,7 @@ class MPAContrastEffect:
     FUNCTION = "apply_contrast"
     CATEGORY = "MPA/video"
     
-    def apply_contrast(self, IMAGE, factor, fps):
+    def apply_contrast(self, IMAGE, factor, fps, precision="fp32"):
         """
         Apply contrast adjustment to video.
         
@@ -47,19 +81,41 @@ class MPAContrastEffect:
             IMAGE: Input video as IMAGE tensor
             factor: Contrast multiplier (1.0 = no change, >1.0 = more contrast, <1.0 = less contrast)
             fps: Frames per second for the video
+            precision: Compute precision for float inputs ("fp32", "bf16" or "fp16")
             
         Returns:
             Tuple containing the contrast-adjusted video as IMAGE tensor
         """
-        # Convert IMAGE tensor to MoviePy clip
-        clip = image_tensor_to_moviepy_clip(IMAGE, fps=fps)
+        # factor == 1.0 is the default and a no-op: skip all pixel work
+        if abs(factor - 1.0) < 1e-6:
+            return (IMAGE,)
+        
+        if IMAGE.is_floating_point():
+            # Contrast is an affine per-pixel transform around mid-grey, so apply
+            # it to the whole batch at once instead of round-tripping through MoviePy.
+            # A new tensor is allocated once; the remaining ops run in place on it
+            # so the upstream IMAGE is never mutated.
+            compute_dtype = resolve_compute_dtype(IMAGE, precision)
+            result_tensor = IMAGE.to(compute_dtype).sub(0.5).mul_(factor).add_(0.5).clamp_(0.0, 1.0)
+            return (result_tensor.to(IMAGE.dtype),)
         
-        # Apply contrast effect using MoviePy's lum_contrast effect
-        # lum_contrast adjusts the contrast by modifying luminance
-        adjusted_clip = clip.with_effects([fx.LumContrast(contrast=factor)])
+        if IMAGE.dtype == torch.bool or IMAGE.is_complex():
+            raise ValueError(f"Unsupported IMAGE dtype: {IMAGE.dtype}")
         
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(adjusted_clip)
+        # Integer IMAGE tensors are in [0, 255]: same transform in that domain,
+        # keeping the input dtype
+        contrast_kernel = None
+        if IMAGE.dtype == torch.uint8 and IMAGE.device.type == "cpu":
+            contrast_kernel = _get_contrast_kernel()
+        
+        if contrast_kernel is not None:
+            # Run a compiled kernel over all pixels; .numpy() shares memory
+            pixels = IMAGE.contiguous().reshape(-1, IMAGE.shape[-1]).numpy()
+            result_tensor = torch.from_numpy(contrast_kernel(pixels, factor)).reshape(IMAGE.shape)
+        else:
+            # Round half up like the compiled kernel, so the result does
+            # not depend on whether numba is installed
+            result_tensor = IMAGE.float().sub_(127.5).mul_(factor).add_(127.5).clamp_(0.0, 255.0)
+            result_tensor = result_tensor.add_(0.5).floor_().to(IMAGE.dtype)
         
         return (result_tensor,)
-
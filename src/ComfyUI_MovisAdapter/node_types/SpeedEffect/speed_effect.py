@@ -1,7 +1,6 @@
 """SpeedEffect node - Changes video playback speed."""
 
-from moviepy.video import fx
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor
+import torch
 
 
 class MPASpeedEffect:
@@ -51,15 +50,20 @@ class MPASpeedEffect:
         Returns:
             Tuple containing the speed-adjusted video as IMAGE tensor
         """
-        # Convert IMAGE tensor to MoviePy clip
-        clip = image_tensor_to_moviepy_clip(IMAGE, fps=fps)
+        # factor == 1.0 is the default and a no-op: skip all pixel work
+        if abs(factor - 1.0) < 1e-6:
+            return (IMAGE,)
         
-        # Apply speed effect using MoviePy's speedx effect
-        # speedx multiplies the playback speed by the factor
-        adjusted_clip = clip.with_effects([fx.MultiplySpeed(factor)])
+        # Changing speed only resamples frames along the time axis, so select
+        # the source frame for every output frame with a single gather instead
+        # of re-rendering the clip through MoviePy
+        num_frames = IMAGE.shape[0]
+        new_length = max(1, int(round(num_frames / factor)))
         
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(adjusted_clip)
+        # Output frame i shows source frame floor(i * N / new_length)
+        indices = (torch.arange(new_length, device=IMAGE.device) * (num_frames / new_length)).long()
+        indices.clamp_(max=num_frames - 1)
+        
+        result_tensor = IMAGE.index_select(0, indices)
         
         return (result_tensor,)
-
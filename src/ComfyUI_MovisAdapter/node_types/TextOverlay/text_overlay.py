@@ -1,7 +1,17 @@
 """TextOverlay node - Adds text overlay to video clips."""
 
-from moviepy import TextClip, CompositeVideoClip
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor
+import re
+from functools import lru_cache
+
+import torch
+from ...common import PRECISION_INPUT, resolve_compute_dtype
+
+
+# "horizontal,vertical" or "left,top,right,bottom"
+_MARGIN_PATTERN = re.compile(r"\s*\d+\s*,\s*\d+\s*(?:,\s*\d+\s*,\s*\d+\s*)?")
+
+# "R,G,B" or "R,G,B,A"
+_COLOR_TUPLE_PATTERN = re.compile(r"\s*\d+\s*(?:,\s*\d+\s*){2,3}")
 
 
 class MPATextOverlay:
@@ -98,6 +108,9 @@ class MPATextOverlay:
                     "default": True,
                     "display": "boolean"
                 }),
+            },
+            "optional": {
+                "precision": PRECISION_INPUT,
             }
         }
     
@@ -106,52 +119,88 @@ class MPATextOverlay:
     FUNCTION = "add_text_overlay"
     CATEGORY = "MPA/video"
     
-    def _parse_margin(self, margin_str):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_margin(margin_str):
         """Parse margin string to tuple or None."""
-        if not margin_str or margin_str.strip() == "":
+        if not margin_str or not _MARGIN_PATTERN.fullmatch(margin_str):
             return None
         
-        try:
-            parts = [p.strip() for p in margin_str.split(',')]
-            if len(parts) == 2:
-                # If only two parts are given, repeat for 4-tuple (left, top, right, bottom)
-                return (int(parts[0]), int(parts[1]), int(parts[0]), int(parts[1]))
-            elif len(parts) == 4:
-                return (int(parts[0]), int(parts[1]), int(parts[2]), int(parts[3]))
-            else:
-                return (None, None)
-        except (ValueError, IndexError):
-            pass
-        
-        return None
+        parts = tuple(int(p) for p in margin_str.split(','))
+        if len(parts) == 2:
+            # If only two parts are given, repeat for 4-tuple (left, top, right, bottom)
+            return (parts[0], parts[1], parts[0], parts[1])
+        
+        return parts
     
-    def _parse_color(self, color_str):
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _parse_color(color_str):
         """Parse color string to appropriate format."""
         if not color_str or color_str.strip() == "":
             return None
         
-        color_str = color_str.strip()
-        
         # Check if it's a tuple format "R,G,B" or "R,G,B,A"
-        if ',' in color_str:
-            try:
-                parts = [int(p.strip()) for p in color_str.split(',')]
-                if len(parts) == 3:
-                    return tuple(parts)
-                elif len(parts) == 4:
-                    return tuple(parts)
-            except ValueError:
-                pass
+        if _COLOR_TUPLE_PATTERN.fullmatch(color_str):
+            return tuple(int(p) for p in color_str.split(','))
         
         # Return as-is (color name or hex)
-        return color_str
+        return color_str.strip()
+    
+    def _render_text(self, text_clip):
+        """Render a static TextClip once as uint8 RGB [h, w, 3] and float alpha [h, w, 1] tensors."""
+        # Text frame is [h, w, 3] in [0, 255], mask is [h, w] in [0, 1]
+        text_rgb = torch.from_numpy(text_clip.get_frame(0)[..., :3])
+        
+        if text_clip.mask is not None:
+            text_alpha = torch.from_numpy(text_clip.mask.get_frame(0)).float().unsqueeze(-1)
+        else:
+            text_alpha = torch.ones((*text_rgb.shape[:2], 1))
+        
+        return text_rgb, text_alpha
+    
+    def _blend_float(self, region, text_rgb, text_alpha, compute_dtype):
+        """Alpha-blend text over a float [B, h, w, 3] region in place."""
+        text_rgb = text_rgb.to(device=region.device, dtype=compute_dtype) / 255.0
+        text_alpha = text_alpha.to(device=region.device, dtype=compute_dtype)
+        
+        # frame * (1 - alpha) + text * alpha, in place when the compute dtype
+        # matches the IMAGE dtype
+        blended = region.to(compute_dtype)
+        blended.mul_(1.0 - text_alpha).add_(text_rgb * text_alpha)
+        if blended.dtype != region.dtype:
+            region.copy_(blended)
+    
+    def _blend_int(self, region, text_rgb, text_alpha):
+        """Alpha-blend text over an integer [B, h, w, 3] region in [0, 255] in place with integer math only."""
+        text_rgb = text_rgb.to(device=region.device, dtype=torch.int32)
+        text_alpha = (text_alpha * 255.0).round_().to(device=region.device, dtype=torch.int32)
+        
+        # frame * (255 - a) + text * a fits in int32; divide by 255 with rounding
+        # via the exact shift form: (x + 128 + ((x + 128) >> 8)) >> 8
+        blended = region.to(torch.int32).mul_(255 - text_alpha).add_(text_rgb * text_alpha).add_(128)
+        blended.add_(blended >> 8).bitwise_right_shift_(8)
+        region.copy_(blended)
+    
+    def _resolve_position(self, pos, text_size, video_size):
+        """Resolve a MoviePy-style (x, y) position with 'left'/'center'/'right'/'top'/'bottom' to pixels."""
+        resolved = []
+        for value, size, canvas in zip(pos, text_size, video_size):
+            if value in ("left", "top"):
+                value = 0
+            elif value == "center":
+                value = (canvas - size) / 2
+            elif value in ("right", "bottom"):
+                value = canvas - size
+            resolved.append(int(value))
+        return tuple(resolved)
     
     def add_text_overlay(
         self, IMAGE, text, position, fps,
         font="", font_size=50, size="", margin="",
         color="black", bg_color="", stroke_color="", stroke_width=0,
         method="caption", text_align="left", horizontal_align="center",
-        vertical_align="center", interline=4.0, transparent=True
+        vertical_align="center", interline=4.0, transparent=True, precision="fp32"
     ):
         """
         Add text overlay to video with full TextClip property support.
@@ -175,15 +224,17 @@ class MPATextOverlay:
             vertical_align: Vertical alignment of text block ('top', 'center', 'bottom')
             interline: Line spacing
             transparent: Whether to support transparency
+            precision: Compute precision for the blend ("fp32", "bf16" or "fp16")
             
         Returns:
             Tuple containing the video with text overlay as IMAGE tensor
         """
-        # Convert IMAGE tensor to MoviePy clip
-        video_clip = image_tensor_to_moviepy_clip(IMAGE, fps=fps)
+        if IMAGE.dtype == torch.bool or IMAGE.is_complex():
+            raise ValueError(f"Unsupported IMAGE dtype: {IMAGE.dtype}")
         
         # Get video dimensions
-        video_width, video_height = video_clip.size
+        # IMAGE tensors are [B, H, W, C]
+        video_height, video_width = IMAGE.shape[1:3]
         
         # Build TextClip parameters
         text_clip_params = {}
@@ -244,7 +295,9 @@ class MPATextOverlay:
         text_clip_params['transparent'] = transparent
         
         # Create text clip
-        text_clip = TextClip(**text_clip_params).with_duration(video_clip.duration)
+        # MoviePy is imported lazily to keep node registration cheap
+        from moviepy import TextClip
+        text_clip = TextClip(**text_clip_params)
         
         # Calculate position based on selected position and alignment settings
         # Position parameter controls vertical placement, horizontal_align controls horizontal
@@ -263,14 +316,29 @@ class MPATextOverlay:
         h_pos = horizontal_align if horizontal_align != 'center' else 'center'
         text_position = (h_pos, v_pos)
         
-        # Set text position
-        text_clip = text_clip.with_position(text_position)
+        # The text is static, so render it once and blend it over every frame
+        # in one vectorized operation instead of compositing each frame in MoviePy
+        compute_dtype = resolve_compute_dtype(IMAGE, precision)
+        text_rgb, text_alpha = self._render_text(text_clip)
+        text_height, text_width = text_rgb.shape[:2]
+        x, y = self._resolve_position(text_position, (text_width, text_height), (video_width, video_height))
         
-        # Composite text over video
-        final_clip = CompositeVideoClip([video_clip, text_clip])
+        # Visible part of the text on the video (the text may be partially off-screen)
+        x_start, x_end = max(x, 0), min(x + text_width, video_width)
+        y_start, y_end = max(y, 0), min(y + text_height, video_height)
         
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(final_clip)
+        result_tensor = IMAGE.clone()
+        if x_start >= x_end or y_start >= y_end:
+            return (result_tensor,)
+        
+        text_rgb = text_rgb[y_start - y:y_end - y, x_start - x:x_end - x]
+        text_alpha = text_alpha[y_start - y:y_end - y, x_start - x:x_end - x]
+        
+        # Composite text over video
+        region = result_tensor[:, y_start:y_end, x_start:x_end, :3]
+        if IMAGE.is_floating_point():
+            self._blend_float(region, text_rgb, text_alpha, compute_dtype)
+        else:
+            self._blend_int(region, text_rgb, text_alpha)
         
         return (result_tensor,)
-
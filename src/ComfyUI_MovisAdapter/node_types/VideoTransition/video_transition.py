@@ -1,9 +1,94 @@
 """VideoTransition node - Adds transitions between video clips."""
 
+import math
+
 import torch
-from moviepy import concatenate_videoclips
-from moviepy.video import fx
-from ...common import image_tensor_to_moviepy_clip, moviepy_clip_to_image_tensor
+from ...common import PRECISION_INPUT, convert_image_tensor, resize_image_tensor, resolve_compute_dtype
+
+
+def _fade_length(fade_frames, num_frames):
+    """
+    Number of frames a fade of fade_frames (duration * fps) covers in a clip.
+    
+    Every frame whose time falls inside the fade is covered, i.e.
+    ceil(duration * fps), capped at the clip length. The small epsilon keeps
+    float noise such as 0.1 * 30 = 3.0000000000000004 from adding a frame.
+    """
+    return min(math.ceil(fade_frames - 1e-9), num_frames)
+
+
+def _fade_in_ramp(num_frames, fade_frames, device, dtype):
+    """Fade-in weights i / fade_frames (MoviePy's t / duration) shaped to broadcast over [k, H, W, C]."""
+    # Built in float32 and cast afterwards: bf16 cannot count frames past 256
+    steps = torch.arange(num_frames, device=device, dtype=torch.float32)
+    return (steps / fade_frames).to(dtype).view(num_frames, 1, 1, 1)
+
+
+def _fade_out_ramp(num_frames, fade_frames, device, dtype):
+    """Fade-out weights for the last k frames of a clip, (k - i) / fade_frames capped at 1.0."""
+    steps = torch.arange(num_frames, 0, -1, device=device, dtype=torch.float32)
+    return (steps / fade_frames).clamp_(max=1.0).to(dtype).view(num_frames, 1, 1, 1)
+
+
+def _store_(out, values):
+    """Copy blended values into out, rounding instead of truncating for integer outputs."""
+    if not out.is_floating_point():
+        values = values.round_()
+    out.copy_(values)
+
+
+def _fade_(frames, weights):
+    """Scale frames in place by per-frame weights, computing in the weights' dtype."""
+    if frames.dtype == weights.dtype:
+        frames.mul_(weights)
+    else:
+        _store_(frames, frames.to(weights.dtype) * weights)
+
+
+def _crossfade_into(out, frames_from, frames_to, weights):
+    """Write frames_from blended towards frames_to by per-frame weights into out."""
+    if out.dtype == weights.dtype:
+        torch.lerp(frames_from, frames_to, weights, out=out)
+    else:
+        _store_(out, torch.lerp(frames_from.to(weights.dtype), frames_to.to(weights.dtype), weights))
+
+
+# Transition handlers. Each one receives the preallocated output buffer, both
+# input clips, the index of the first frame of the second clip in the output,
+# the fade length in frames and the dtype to compute the weights in, and only
+# touches the transition window.
+
+def _crossfade(result, frames1, frames2, boundary, fade_frames, dtype):
+    """Blend the last k frames of the first clip into the first k frames of the second."""
+    k = _fade_length(fade_frames, min(frames1.shape[0], frames2.shape[0]))
+    weights = _fade_in_ramp(k, fade_frames, result.device, dtype)
+    _crossfade_into(result[boundary - k:boundary], frames1[-k:], frames2[:k], weights)
+
+
+def _fade_in(result, frames1, frames2, boundary, fade_frames, dtype):
+    """Fade in only the second clip from black."""
+    k = _fade_length(fade_frames, frames2.shape[0])
+    _fade_(result[boundary:boundary + k], _fade_in_ramp(k, fade_frames, result.device, dtype))
+
+
+def _fade_out(result, frames1, frames2, boundary, fade_frames, dtype):
+    """Fade out only the first clip to black."""
+    k = _fade_length(fade_frames, frames1.shape[0])
+    _fade_(result[boundary - k:boundary], _fade_out_ramp(k, fade_frames, result.device, dtype))
+
+
+def _fade_in_out(result, frames1, frames2, boundary, fade_frames, dtype):
+    """Fade out the first clip and fade in the second clip."""
+    _fade_out(result, frames1, frames2, boundary, fade_frames, dtype)
+    _fade_in(result, frames1, frames2, boundary, fade_frames, dtype)
+
+
+_TRANSITION_HANDLERS = {
+    "crossfade": _crossfade,
+    "fadein": _fade_in,
+    "fadeout": _fade_out,
+    "fadeinout": _fade_in_out,
+}
 
 
 class MPAVideoTransition:
@@ -20,7 +105,7 @@ class MPAVideoTransition:
             "required": {
                 "IMAGE1": ("IMAGE",),
                 "IMAGE2": ("IMAGE",),
-                "transition_type": (["crossfade", "fadein", "fadeout", "fadeinout"],),
+                "transition_type": (list(_TRANSITION_HANDLERS),),
                 "duration": ("FLOAT", {
                     "default": 1.0,
                     "min": 0.1,
@@ -35,6 +120,9 @@ class MPAVideoTransition:
                     "step": 0.1,
                     "display": "number"
                 }),
+            },
+            "optional": {
+                "precision": PRECISION_INPUT,
             }
         }
     
@@ -43,7 +131,7 @@ class MPAVideoTransition:
     FUNCTION = "add_transition"
     CATEGORY = "MPA/video"
     
-    def add_transition(self, IMAGE1, IMAGE2, transition_type, duration, fps):
+    def add_transition(self, IMAGE1, IMAGE2, transition_type, duration, fps, precision="fp32"):
         """
         Add transition between two videos.
         
@@ -53,35 +141,43 @@ class MPAVideoTransition:
             transition_type: Type of transition (crossfade, fadein, fadeout, fadeinout)
             duration: Duration of the transition in seconds
             fps: Frames per second for the output video
+            precision: Compute precision for the blend ("fp32", "bf16" or "fp16")
             
         Returns:
             Tuple containing the video with transition as IMAGE tensor
         """
-        # Convert IMAGE tensors to MoviePy clips
-        clip1 = image_tensor_to_moviepy_clip(IMAGE1, fps=fps)
-        clip2 = image_tensor_to_moviepy_clip(IMAGE2, fps=fps)
+        if transition_type not in _TRANSITION_HANDLERS:
+            raise ValueError(f"Unknown transition type: {transition_type}. Expected one of {list(_TRANSITION_HANDLERS)}")
         
-        # Apply transition based on type
-        if transition_type == "crossfade":
-            # Crossfade: first clip fades out while second fades in
-            clip1 = clip1.with_effects([fx.CrossFadeOut(duration)])
-            clip2 = clip2.with_effects([fx.CrossFadeIn(duration)])
-        elif transition_type == "fadein":
-            # Only fade in the second clip
-            clip2 = clip2.with_effects([fx.FadeIn(duration=duration)])
-        elif transition_type == "fadeout":
-            # Only fade out the first clip
-            clip1 = clip1.with_effects([fx.FadeOut(duration=duration)])
-        elif transition_type == "fadeinout":
-            # Fade out first clip and fade in second clip
-            clip1 = clip1.with_effects([fx.FadeOut(duration=duration)])
-            clip2 = clip2.with_effects([fx.FadeIn(duration=duration)])
+        # Second video must match the first one's resolution, device and dtype
+        # IMAGE tensors are [B, H, W, C]
+        height, width = IMAGE1.shape[1:3]
+        IMAGE2 = convert_image_tensor(resize_image_tensor(IMAGE2, width, height), IMAGE1.dtype, IMAGE1.device)
         
-        # Concatenate the clips
-        combined_clip = concatenate_videoclips([clip1, clip2], method="compose")
+        # Fade length in frames, possibly fractional like MoviePy's duration
+        fade_frames = duration * fps
+        num_frames1, num_frames2 = IMAGE1.shape[0], IMAGE2.shape[0]
+        num_overlap_frames = _fade_length(fade_frames, min(num_frames1, num_frames2))
+        if num_overlap_frames <= 0:
+            return (torch.cat([IMAGE1, IMAGE2], dim=0),)
         
-        # Convert back to IMAGE tensor
-        result_tensor = moviepy_clip_to_image_tensor(combined_clip)
+        # Crossfade overlaps the clips by its window, the fades keep both in full
+        overlap = num_overlap_frames if transition_type == "crossfade" else 0
+        
+        # Write both clips straight into one preallocated output buffer, then
+        # apply the transition to the boundary frames in place. Fades only touch
+        # the transition window and leave the rest of both videos untouched
+        result_tensor = torch.empty(
+            (num_frames1 + num_frames2 - overlap, *IMAGE1.shape[1:]),
+            dtype=IMAGE1.dtype,
+            device=IMAGE1.device,
+        )
+        result_tensor[:num_frames1 - overlap].copy_(IMAGE1[:num_frames1 - overlap])
+        result_tensor[num_frames1:].copy_(IMAGE2[overlap:])
+        
+        # Apply the transition to its window only
+        _TRANSITION_HANDLERS[transition_type](
+            result_tensor, IMAGE1, IMAGE2, num_frames1, fade_frames, resolve_compute_dtype(IMAGE1, precision)
+        )
         
         return (result_tensor,)
-